@@ -1,17 +1,43 @@
 import yfinance as yf
 import pandas as pd
-import pandas_ta as pta
-import ta
-from datetime import datetime
-import matplotlib.pyplot as plt
+import numpy as np
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import schedule
 import time
 import os
+import json
+import tempfile
+import functools
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+try:
+    import talib
+except ImportError:  # TA-Lib needs its C library; fall back to pandas EWMA
+    talib = None
+
+try:
+    import bottleneck as bn
+except ImportError:  # fall back to pandas rolling for MA200
+    bn = None
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # run the kernels as plain Python when numba is unavailable
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # ===== Slack Webhook URL =====
 SLACK_WEBHOOK_URL = os.getenv("MY_WEBHOOK_URL")
 PERIOD = "2y"
@@ -19,54 +45,71 @@ RSI_BUY = 40
 RSI_SELL = 70
 PE_BUY_MAX = 25
 MA_PERIOD = 200
+RSI_WINDOW = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
 OUT_DIR = "results"
 PLOT_DIR = os.path.join(OUT_DIR, "plots")
+MAX_WORKERS = 8
+# set GENERATE_PLOTS=0 for Slack-only runs; skips importing matplotlib and rendering PNGs
+GENERATE_PLOTS = os.getenv("GENERATE_PLOTS", "1") == "1"
+# set USE_NUMBA=0 to benchmark the pure NumPy trade simulation instead of the Numba kernel
+USE_NUMBA = HAS_NUMBA and os.getenv("USE_NUMBA", "1") == "1"
+PE_CACHE_DIR = os.path.join(".cache", "pe")
+PE_CACHE_TTL = 24 * 60 * 60  # seconds; PE ratios move at most daily
+PRICE_CACHE_DIR = os.path.join(".cache", "px")
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_CLOSE_HOUR = 16
 
 if not SLACK_WEBHOOK_URL:
     raise ValueError("❌ Environment variable MY_WEBHOOK_URL not set! Please configure it in GitHub Secrets.")
 
+# one pooled keep-alive session for outgoing webhooks, with retries on flaky connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3)))
+
 # ===== ETF 列表 =====
 ETF_LIST = ["VOO", "SPY", "VTI", "ARKK", "AAPL", "MSFT", "GOOG", "TSLA",
             "DXCM", "NVDA", "AXP", "ISRG", "COST", "ASML", "AMZN", "META",
             "QQQ", "QQQM", "SCHD", "UNH", "AMD", "TSM", "JPM", "DIS", "T",
             "PYPL", "TDOC", "QCOM", "MA", "V", "HD", "ORCL", "VWO", "LMT"]
 
-def analyze_etf(ticker):
-    """Analyze a single ETF and return a buy signal dict or None."""
+def analyze_etf(ticker, ind=None):
+    """Analyze a single ETF from its indicator frame and return a buy signal dict or None."""
     try:
-        # download 1 year of data
-        data = yf.download(ticker, period="1y", progress=False, auto_adjust=False)
-
-        if data is None or data.empty:
-            print(f"No data for {ticker}")
-            return None
-
-        # compute indicators using the shared compute_indicators (returns columns: Close, RSI, MACD, MACD_signal, MACD_diff, MA200)
-        ind = compute_indicators(data)
+        # compute indicators from a fresh download unless the caller already has them
+        if ind is None:
+            try:
+                ind = compute_indicators(fetch_price_df(ticker, period="1y"))
+            except SystemExit:  # fetch_price_df exits on an empty download
+                print(f"No data for {ticker}")
+                return None
 
         # need at least two rows to detect a cross
         if len(ind) < 2:
             return None
 
-        today = ind.iloc[-1]
-        yesterday = ind.iloc[-2]
+        rsi = ind["RSI"].iat[-1]
+        macd, macd_prev = ind["MACD"].iat[-1], ind["MACD"].iat[-2]
+        macd_signal, macd_signal_prev = ind["MACD_signal"].iat[-1], ind["MACD_signal"].iat[-2]
 
         # ensure required values are present
-        if pd.isna(today["RSI"]) or pd.isna(today["MACD"]) or pd.isna(today["MACD_signal"]):
+        if pd.isna(rsi) or pd.isna(macd) or pd.isna(macd_signal):
             return None
 
         # strategy: MACD crosses above signal + RSI below threshold
-        macd_cross = (yesterday["MACD"] < yesterday["MACD_signal"]) and (today["MACD"] > today["MACD_signal"])
-        rsi_buy = today["RSI"] < RSI_BUY
+        macd_cross = (macd_prev < macd_signal_prev) and (macd > macd_signal)
+        rsi_buy = rsi < RSI_BUY
 
         if macd_cross and rsi_buy:
             return {
                 "ticker": ticker,
-                "price": round(float(today["Close"]), 2),
-                "rsi": round(float(today["RSI"]), 2),
-                "macd": round(float(today["MACD"]), 4),
-                "macd_signal": round(float(today["MACD_signal"]), 4),
-                "date": today.name.strftime("%Y-%m-%d")
+                "price": round(float(ind["Close"].iat[-1]), 2),
+                "rsi": round(float(rsi), 2),
+                "macd": round(float(macd), 4),
+                "macd_signal": round(float(macd_signal), 4),
+                "date": ind.index[-1].strftime("%Y-%m-%d")
             }
         return None
 
@@ -79,20 +122,22 @@ def send_slack_message(message: str):
     """发送 Slack 通知"""
     try:
         payload = {"text": message}
-        requests.post(SLACK_WEBHOOK_URL, json=payload)
+        SESSION.post(SLACK_WEBHOOK_URL, json=payload, timeout=5)
         print("✅ Slack message sent!")
     except Exception as e:
         print(f"Slack error: {e}")
 
 
-def daily_check():
+def daily_check(indicator_dfs=None):
     """每天运行一次的主函数"""
     print(f"📊 Running ETF check at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
     buy_signals = []
+    if indicator_dfs is None:
+        indicator_dfs = load_indicator_dfs(ETF_LIST)
 
-    for ticker in ETF_LIST:
-        signal = analyze_etf(ticker)
+    for ticker, ind in indicator_dfs.items():
+        signal = analyze_etf(ticker, ind)
         if signal:
             buy_signals.append(signal)
 
@@ -115,161 +160,371 @@ def safe_series(df, col):
     return pd.Series(s.values, index=df.index, name=col)
 
 
+def _atomic_write(path, write):
+    # write to a temp file and rename so readers never see a partial file
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _last_market_close():
+    """Epoch seconds of the most recent weekday 16:00 New York close (holidays just refetch)."""
+    now = datetime.now(MARKET_TZ)
+    close = now.replace(hour=MARKET_CLOSE_HOUR, minute=0, second=0, microsecond=0)
+    if now < close:
+        close -= timedelta(days=1)
+    while close.weekday() >= 5:
+        close -= timedelta(days=1)
+    return close.timestamp()
+
+
+def _price_cache_path(ticker, period):
+    return os.path.join(PRICE_CACHE_DIR, f"{ticker}_{period}.pkl")
+
+
+def _read_price_cache(ticker, period):
+    """Return the pickled price frame if it was saved after the last market close, else None."""
+    path = _price_cache_path(ticker, period)
+    try:
+        if os.path.getmtime(path) < _last_market_close():
+            return None
+        return pd.read_pickle(path)
+    except Exception:
+        return None
+
+
+def _write_price_cache(ticker, period, df):
+    try:
+        _atomic_write(_price_cache_path(ticker, period), df.to_pickle)
+    except OSError as e:
+        print(f"Price cache write failed for {ticker}: {e}")
+
+
 def fetch_price_df(ticker, period=PERIOD):
+    # callers add indicator columns in place, so hand out copies of the cached frame.
+    # The in-process lru_cache layer ignores the market-close expiry of the disk cache and
+    # keeps a frame for the life of the process; a long-running (e.g. scheduled) process
+    # must call _fetch_price_df.cache_clear() before each run to avoid stale prices.
+    return _fetch_price_df(ticker, period).copy()
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_price_df(ticker, period):
+    df = _read_price_cache(ticker, period)
+    if df is not None:
+        return df
     df = yf.download(ticker, period=period, progress=False, auto_adjust=False)
     if df.empty:
         raise SystemExit(f"No data downloaded for {ticker}")
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = [c[0] for c in df.columns]
     df.index = pd.to_datetime(df.index)
+    _write_price_cache(ticker, period, df)
     return df
 
 
+def fetch_bulk_price_dfs(tickers, period=PERIOD):
+    """Download all uncached tickers in one threaded request and split it per ticker."""
+    price_dfs = {}
+    for ticker in tickers:
+        cached = _read_price_cache(ticker, period)
+        if cached is not None:
+            price_dfs[ticker] = cached
+
+    missing = [t for t in tickers if t not in price_dfs]
+    if missing:
+        bulk = yf.download(missing, period=period, group_by="ticker", threads=True,
+                           progress=False, auto_adjust=False)
+        for ticker in missing:
+            if bulk is None or ticker not in bulk.columns.get_level_values(0):
+                price_dfs[ticker] = pd.DataFrame()
+                continue
+            df = bulk[ticker].dropna(how="all")
+            df.index = pd.to_datetime(df.index)
+            price_dfs[ticker] = df
+            if not df.empty:
+                _write_price_cache(ticker, period, df)
+    return {t: price_dfs[t] for t in tickers}
+
+
+def load_indicator_dfs(tickers, period=PERIOD):
+    """Fetch every ticker once and compute its indicators once, for both checks to share."""
+    price_dfs = fetch_bulk_price_dfs(tickers, period)
+    indicator_dfs = {}
+    for ticker in tickers:
+        if price_dfs[ticker].empty:
+            print(f"No data for {ticker}")
+            continue
+        indicator_dfs[ticker] = compute_indicators(price_dfs[ticker])
+    return indicator_dfs
+
+
+def _talib_rsi_macd(close):
+    # TA-Lib works on raw float64 arrays; results stay arrays until assigned to the frame
+    values = close.to_numpy(dtype=np.float64)
+    rsi = talib.RSI(values, timeperiod=RSI_WINDOW)
+    macd, macd_signal, macd_diff = talib.MACD(values, fastperiod=MACD_FAST, slowperiod=MACD_SLOW,
+                                              signalperiod=MACD_SIGNAL)
+    return rsi, macd, macd_signal, macd_diff
+
+
+def _ewm_rsi_macd(close):
+    # Wilder RSI and MACD as plain EWMA recurrences (same warm-up as the ta library)
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0.0)
+    loss = -delta.where(delta < 0, 0.0)
+    avg_gain = gain.ewm(alpha=1 / RSI_WINDOW, min_periods=RSI_WINDOW, adjust=False).mean()
+    avg_loss = loss.ewm(alpha=1 / RSI_WINDOW, min_periods=RSI_WINDOW, adjust=False).mean()
+    rsi = (100 - 100 / (1 + avg_gain / avg_loss)).where(avg_loss != 0, 100.0)
+    ema_fast = close.ewm(span=MACD_FAST, min_periods=MACD_FAST, adjust=False).mean()
+    ema_slow = close.ewm(span=MACD_SLOW, min_periods=MACD_SLOW, adjust=False).mean()
+    macd = ema_fast - ema_slow
+    macd_signal = macd.ewm(span=MACD_SIGNAL, min_periods=MACD_SIGNAL, adjust=False).mean()
+    macd_diff = macd - macd_signal
+    return rsi, macd, macd_signal, macd_diff
+
+
 def compute_indicators(df):
-    close = safe_series(df, "Close")
-    rsi = ta.momentum.RSIIndicator(close, window=14).rsi()
-    macd_obj = ta.trend.MACD(close, window_slow=26, window_fast=12, window_sign=9)
-    macd = macd_obj.macd()
-    macd_signal = macd_obj.macd_signal()
-    macd_diff = macd_obj.macd_diff()
-    ma200 = close.rolling(window=MA_PERIOD, min_periods=1).mean()
-    return pd.DataFrame({
-        "Close": close,
-        "RSI": rsi,
-        "MACD": macd,
-        "MACD_signal": macd_signal,
-        "MACD_diff": macd_diff,
-        "MA200": ma200
-    })
+    # prices carry ~5 significant digits and the signals only test signs and crosses,
+    # so float32 is plenty and halves the size of every price/indicator column
+    close = safe_series(df, "Close").astype(np.float32)
+    if talib is not None:
+        rsi, macd, macd_signal, macd_diff = _talib_rsi_macd(close)
+    else:
+        rsi, macd, macd_signal, macd_diff = _ewm_rsi_macd(close)
+    # bottleneck rejects windows longer than the series, so short histories use pandas rolling
+    if bn is not None and len(close) >= MA_PERIOD:
+        # call bottleneck's C moving mean directly instead of going through pandas' rolling engine
+        ma200 = bn.move_mean(close.to_numpy(), window=MA_PERIOD, min_count=1)
+    else:
+        ma200 = close.rolling(window=MA_PERIOD, min_periods=1).mean()
+    # add the indicator columns in place; OHLCV columns stay available to callers.
+    # pandas ewm/rolling compute in float64, so narrow their results back to float32
+    df["Close"] = close
+    df["RSI"] = np.asarray(rsi, dtype=np.float32)
+    df["MACD"] = np.asarray(macd, dtype=np.float32)
+    df["MACD_signal"] = np.asarray(macd_signal, dtype=np.float32)
+    df["MACD_diff"] = np.asarray(macd_diff, dtype=np.float32)
+    df["MA200"] = np.asarray(ma200, dtype=np.float32)
+    return df
+
+
+def _read_pe_cache(ticker):
+    """Return the cached {"pe", "ts"} entry for ticker, or None if missing/expired."""
+    try:
+        with open(os.path.join(PE_CACHE_DIR, f"{ticker}.json")) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - cached.get("ts", 0) >= PE_CACHE_TTL:
+        return None
+    return cached
 
 
+def _write_pe_cache(ticker, pe):
+    payload = json.dumps({"pe": pe, "ts": time.time()}).encode()
+    try:
+        _atomic_write(os.path.join(PE_CACHE_DIR, f"{ticker}.json"), lambda f: f.write(payload))
+    except OSError as e:
+        print(f"PE cache write failed for {ticker}: {e}")
+
+
+@functools.lru_cache(maxsize=128)
 def fetch_pe(ticker):
+    cached = _read_pe_cache(ticker)
+    if cached is not None:
+        return cached["pe"]
     try:
+        # fast_info has no PE field, so the slower .info lookup is still needed
         info = yf.Ticker(ticker).info
         pe = info.get("trailingPE") or info.get("trailing_pe") or info.get("peRatio")
-        return float(pe) if pe is not None else None
+        pe = float(pe) if pe is not None else None
     except Exception:
         return None
-
-
-def compute_indicators(df):
-    close = safe_series(df, "Close")
-    rsi = ta.momentum.RSIIndicator(close, window=14).rsi()
-    macd_obj = ta.trend.MACD(close, window_slow=26, window_fast=12, window_sign=9)
-    macd = macd_obj.macd()
-    macd_signal = macd_obj.macd_signal()
-    macd_diff = macd_obj.macd_diff()
-    ma200 = close.rolling(window=MA_PERIOD, min_periods=1).mean()
-    return pd.DataFrame({
-        "Close": close,
-        "RSI": rsi,
-        "MACD": macd,
-        "MACD_signal": macd_signal,
-        "MACD_diff": macd_diff,
-        "MA200": ma200
-    })
+    _write_pe_cache(ticker, pe)
+    return pe
 
 
 def generate_signals(df, pe_val):
-    macd_cross_up = (df["MACD"] > df["MACD_signal"]) & (df["MACD"].shift(1) <= df["MACD_signal"].shift(1))
-    macd_cross_down = (df["MACD"] < df["MACD_signal"]) & (df["MACD"].shift(1) >= df["MACD_signal"].shift(1))
-    cond_rsi_buy = df["RSI"] < RSI_BUY
-    cond_rsi_sell = df["RSI"] > RSI_SELL
-    cond_close_above_ma = df["Close"] > df["MA200"]
-    cond_close_below_ma = df["Close"] < df["MA200"]
+    # boolean algebra on plain arrays; only the two results are written back as columns
+    close = df["Close"].to_numpy()
+    macd = df["MACD"].to_numpy()
+    macd_signal = df["MACD_signal"].to_numpy()
+    rsi = df["RSI"].to_numpy()
+    ma200 = df["MA200"].to_numpy()
+
+    macd_cross_up = np.zeros(len(df), dtype=bool)
+    macd_cross_up[1:] = (macd[1:] > macd_signal[1:]) & (macd[:-1] <= macd_signal[:-1])
+    macd_cross_down = np.zeros(len(df), dtype=bool)
+    macd_cross_down[1:] = (macd[1:] < macd_signal[1:]) & (macd[:-1] >= macd_signal[:-1])
     cond_pe_buy = True if pe_val is None else (pe_val < PE_BUY_MAX)
     cond_pe_sell = True if pe_val is None else (pe_val > PE_BUY_MAX)
 
-    buy_signal = cond_rsi_buy & macd_cross_up & cond_close_below_ma & cond_pe_buy
-    sell_signal = cond_rsi_sell & macd_cross_down & cond_close_above_ma & cond_pe_sell
+    buy_signal = np.logical_and.reduce([rsi < RSI_BUY, macd_cross_up, close < ma200]) & cond_pe_buy
+    sell_signal = np.logical_and.reduce([rsi > RSI_SELL, macd_cross_down, close > ma200]) & cond_pe_sell
 
     df["Buy_Signal"] = buy_signal
     df["Sell_Signal"] = sell_signal
     return df
 
 
+# an explicit signature compiles at import time instead of on the first call, and cache=True
+# reuses the machine code across runs (CI keeps it in NUMBA_CACHE_DIR). Inputs are declared
+# read-only because pandas hands out read-only views under copy-on-write; writable arrays
+# convert to that type too.
+@njit("Tuple((int64[:], int64[:], float64[:], float64[:]))("
+      "Array(boolean, 1, 'A', readonly=True), Array(boolean, 1, 'A', readonly=True), "
+      "Array(float64, 1, 'A', readonly=True))", cache=True)
+def _simulate(buy_signals, sell_signals, close):
+    # a trade needs a buy bar and a later sell bar, so n // 2 + 1 slots always suffice
+    n = close.shape[0]
+    size = n // 2 + 1
+    buy_idx = np.empty(size, dtype=np.int64)
+    sell_idx = np.full(size, -1, dtype=np.int64)
+    buy_price = np.empty(size, dtype=np.float64)
+    sell_price = np.full(size, np.nan)
+    count = 0
+    position_open = False
+    for i in range(n):
+        if buy_signals[i] and not position_open:
+            buy_idx[count] = i
+            buy_price[count] = close[i]
+            count += 1
+            position_open = True
+        elif sell_signals[i] and position_open:
+            sell_idx[count - 1] = i
+            sell_price[count - 1] = close[i]
+            position_open = False
+    return buy_idx[:count], sell_idx[:count], buy_price[:count], sell_price[:count]
+
+
+def _simulate_vectorized(buy_signals, sell_signals, close):
+    # the position after bar i is set by the last buy/sell event up to i, so forward-fill
+    # the event index and read trade boundaries off the position changes.
+    # (buy and sell never fire on the same bar: RSI_BUY < RSI_SELL)
+    n = close.shape[0]
+    event = np.where(buy_signals, 1, np.where(sell_signals, -1, 0))
+    last_event = np.maximum.accumulate(np.where(event != 0, np.arange(n), -1))
+    position = np.zeros(n, dtype=np.bool_)
+    seen = last_event >= 0
+    position[seen] = event[last_event[seen]] > 0
+    prev_position = np.concatenate(([False], position[:-1]))
+    buy_idx = np.flatnonzero(position & ~prev_position)
+    sell_idx = np.flatnonzero(~position & prev_position)
+    sell_idx = np.concatenate((sell_idx, np.full(len(buy_idx) - len(sell_idx), -1, dtype=sell_idx.dtype)))
+    buy_price = close[buy_idx]
+    sell_price = np.where(sell_idx >= 0, close[sell_idx], np.nan)
+    return buy_idx, sell_idx, buy_price, sell_price
+
+
 def simulate_trades(df):
-    trades = []
-    position = None
-    for dt, row in df.iterrows():
-        if row["Buy_Signal"] and position is None:
-            position = {"buy_date": dt, "buy_price": float(row["Close"])}
-            trades.append(position)
-        elif row["Sell_Signal"] and position is not None:
-            position["sell_date"] = dt
-            position["sell_price"] = float(row["Close"])
-            position["profit_pct"] = (position["sell_price"] - position["buy_price"]) / position["buy_price"] * 100
-            position = None
-    if position is not None and "sell_date" not in position:
-        position["sell_date"] = None
-        position["sell_price"] = None
-        position["profit_pct"] = None
-    return pd.DataFrame(trades)
+    simulate = _simulate if USE_NUMBA else _simulate_vectorized
+    buy_idx, sell_idx, buy_price, sell_price = simulate(
+        df["Buy_Signal"].to_numpy(dtype=np.bool_),
+        df["Sell_Signal"].to_numpy(dtype=np.bool_),
+        df["Close"].to_numpy(dtype=np.float64),
+    )
+    dates = df.index.values
+    # a position still open at the end has sell_idx == -1
+    sell_dates = np.where(sell_idx >= 0, dates[sell_idx], np.datetime64("NaT"))
+    # every column is already a typed array, so build the frame once without copying them
+    return pd.DataFrame({
+        "buy_date": dates[buy_idx],
+        "buy_price": buy_price,
+        "sell_date": sell_dates,
+        "sell_price": sell_price,
+        "profit_pct": (sell_price - buy_price) / buy_price * 100,
+    }, copy=False)
 
 
 def plot_signals(ticker, df):
-    plt.figure(figsize=(12, 8))
-    ax1 = plt.subplot(3, 1, 1)
+    # matplotlib is slow to import and only needed here, so load it on first use
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    # a standalone Figure + Agg canvas keeps plotting thread-safe and out of pyplot's
+    # figure registry, so nothing needs closing and nothing leaks across tickers
+    fig = Figure(figsize=(12, 8))
+    FigureCanvasAgg(fig)
+    ax1, ax2, ax3 = fig.subplots(3, 1, sharex=True)
     ax1.plot(df.index, df["Close"], label="Close")
     ax1.plot(df.index, df["MA200"], label="MA200", linestyle="--")
-    ax1.scatter(df[df["Buy_Signal"]].index, df[df["Buy_Signal"]]["Close"], marker="^", color="g", label="Buy", zorder=5)
-    ax1.scatter(df[df["Sell_Signal"]].index, df[df["Sell_Signal"]]["Close"], marker="v", color="r", label="Sell", zorder=5)
+    buys = df.loc[df["Buy_Signal"], "Close"]
+    sells = df.loc[df["Sell_Signal"], "Close"]
+    ax1.scatter(buys.index, buys.to_numpy(), marker="^", color="g", label="Buy", zorder=5)
+    ax1.scatter(sells.index, sells.to_numpy(), marker="v", color="r", label="Sell", zorder=5)
     ax1.set_title(f"{ticker} Price & Signals")
     ax1.legend()
 
-    ax2 = plt.subplot(3, 1, 2, sharex=ax1)
     ax2.plot(df.index, df["RSI"], label="RSI")
     ax2.axhline(70, color="r", linestyle="--")
     ax2.axhline(30, color="g", linestyle="--")
     ax2.legend()
 
-    ax3 = plt.subplot(3, 1, 3, sharex=ax1)
     ax3.plot(df.index, df["MACD"], label="MACD")
     ax3.plot(df.index, df["MACD_signal"], label="Signal", linestyle="--")
     ax3.bar(df.index, df["MACD_diff"], label="MACD_diff", alpha=0.3)
     ax3.legend()
 
-    plt.tight_layout()
+    fig.tight_layout()
     os.makedirs(PLOT_DIR, exist_ok=True)
     out_path = os.path.join(PLOT_DIR, f"{ticker}.png")
-    plt.savefig(out_path)
-    plt.close()
+    fig.savefig(out_path)
     print(f"Saved plot: {out_path}")
 
 
-def second_check():
-    summary = []
-    os.makedirs(OUT_DIR, exist_ok=True)
-    for ticker in ETF_LIST:
-        print("=" * 80)
-        print(f"Processing {ticker} ...")
-
-        df = fetch_price_df(ticker)
-        df = compute_indicators(df)
-        pe_val = fetch_pe(ticker)
-        df = generate_signals(df, pe_val)
-        trades = simulate_trades(df)
-
-        latest_close = df["Close"].iloc[-1]
-        latest_ma200 = df["MA200"].iloc[-1]
-        recommended_buy_price = min(latest_ma200, latest_close * 0.97)
-        has_buy_signal = df["Buy_Signal"].iloc[-1]
-        has_sell_signal = df["Sell_Signal"].iloc[-1]
-
-        # 保存结果
-        df.to_csv(os.path.join(OUT_DIR, f"{ticker}_signals.csv"))
-        trades.to_csv(os.path.join(OUT_DIR, f"{ticker}_trades.csv"), index=False)
+def process_ticker(ticker, df):
+    print("=" * 80)
+    print(f"Processing {ticker} ...")
+
+    pe_val = fetch_pe(ticker)
+    df = generate_signals(df, pe_val)
+    trades = simulate_trades(df)
+
+    latest_close = df["Close"].iat[-1]
+    latest_ma200 = df["MA200"].iat[-1]
+    recommended_buy_price = min(latest_ma200, latest_close * 0.97)
+    has_buy_signal = df["Buy_Signal"].iat[-1]
+    has_sell_signal = df["Sell_Signal"].iat[-1]
+
+    # 保存结果 (per-ticker detail as compressed parquet; summary.csv stays human-readable)
+    df.to_parquet(os.path.join(OUT_DIR, f"{ticker}_signals.parquet"), engine="pyarrow", compression="snappy")
+    trades.to_parquet(os.path.join(OUT_DIR, f"{ticker}_trades.parquet"), engine="pyarrow",
+                      compression="snappy", index=False)
+    if GENERATE_PLOTS:
         plot_signals(ticker, df)
 
-        summary.append({
-            "Ticker": ticker,
-            "PE": pe_val,
-            "Latest_Close": round(latest_close, 2),
-            "MA200": round(latest_ma200, 2),
-            "Buy_Signal_Today": bool(has_buy_signal),
-            "Sell_Signal_Today": bool(has_sell_signal),
-            "Recommended_Buy_Price": round(float(recommended_buy_price), 2)
-        })
+    return {
+        "Ticker": ticker,
+        "PE": pe_val,
+        "Latest_Close": round(float(latest_close), 2),
+        "MA200": round(float(latest_ma200), 2),
+        "Buy_Signal_Today": bool(has_buy_signal),
+        "Sell_Signal_Today": bool(has_sell_signal),
+        "Recommended_Buy_Price": round(float(recommended_buy_price), 2)
+    }
+
+
+def second_check(indicator_dfs=None):
+    os.makedirs(OUT_DIR, exist_ok=True)
+    if indicator_dfs is None:
+        indicator_dfs = load_indicator_dfs(ETF_LIST)
+    if not indicator_dfs:
+        msg = "⚠️ No price data downloaded for any ticker; ETF summary skipped."
+        print(msg)
+        send_slack_message(msg)
+        send_email(msg)
+        return
+    # tickers are independent: overlap PE lookups and disk writes with other tickers' compute
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        summary = list(ex.map(process_ticker, indicator_dfs.keys(), indicator_dfs.values()))
     summary_df = pd.DataFrame(summary)
     summary_df.to_csv(os.path.join(OUT_DIR, "summary.csv"), index=False)
     print("\nAll done! ✅ Summary:")
@@ -309,8 +564,10 @@ def send_email(body):
 def main():
     """Main entry point of the program."""
     print("🚀 Starting daily check process...")
-    daily_check()
-    second_check()
+    # one 2y download and one indicator pass per ticker, shared by both checks
+    indicator_dfs = load_indicator_dfs(ETF_LIST)
+    daily_check(indicator_dfs)
+    second_check(indicator_dfs)
     print("✅ Daily check completed successfully!")
 
 
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# main.py refuses to import without a webhook URL; the tests never post to it
+os.environ.setdefault("MY_WEBHOOK_URL", "https://hooks.slack.invalid/test")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.main import _ewm_rsi_macd
+
+# reference values produced by ta==0.11.0 (RSIIndicator(window=14), MACD(26, 12, 9)),
+# which the EWMA implementation replaced
+CLOSE = pd.Series([100.0, 101.5, 100.8, 102.3, 103.1, 102.0, 101.2, 102.8, 104.0, 105.2,
+                   104.6, 103.9, 105.5, 106.1, 105.0, 104.2, 103.5, 104.8, 106.3, 107.0,
+                   106.2, 105.8, 107.4, 108.1, 107.5, 106.9, 108.3, 109.0, 108.2, 107.6,
+                   106.8, 107.9, 109.4, 110.2, 109.5, 108.7, 110.1, 111.0, 110.4, 109.8])
+
+
+@pytest.mark.parametrize("index, expected_nans, expected_tail", [
+    (0, 13, [66.0968718731, 62.8322666003, 59.6589731958]),  # RSI
+    (1, 25, [1.5635240658, 1.5636735854, 1.4981078406]),     # MACD
+    (2, 33, [1.4887679167, 1.5037490505, 1.5026208085]),     # MACD signal
+    (3, 33, [0.0747561491, 0.0599245350, -0.0045129679]),    # MACD diff
+])
+def test_ewm_rsi_macd_matches_ta(index, expected_nans, expected_tail):
+    values = np.asarray(_ewm_rsi_macd(CLOSE)[index], dtype=np.float64)
+    # same warm-up as ta: leading NaNs only, then fully populated
+    assert np.isnan(values[:expected_nans]).all()
+    assert not np.isnan(values[expected_nans:]).any()
+    assert values[-3:] == pytest.approx(expected_tail, abs=1e-9)
+
+
+def test_rsi_is_100_without_losses():
+    close = pd.Series(np.arange(100.0, 130.0))
+    rsi = np.asarray(_ewm_rsi_macd(close)[0], dtype=np.float64)
+    assert np.isnan(rsi[:13]).all()
+    assert (rsi[13:] == 100.0).all()
+
+
+def random_walk(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.Series(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n))))
+
+
+def test_talib_warm_up():
+    pytest.importorskip("talib")
+    from src.main import _talib_rsi_macd
+
+    # TA-Lib drops one more bar than ta for RSI and starts MACD only once the signal line is seeded
+    for values, expected_nans in zip(_talib_rsi_macd(random_walk(504)), [14, 33, 33, 33]):
+        assert np.isnan(values[:expected_nans]).all()
+        assert not np.isnan(values[expected_nans:]).any()
+
+
+def test_talib_agrees_with_ewm_after_warm_up():
+    pytest.importorskip("talib")
+    from src.main import _talib_rsi_macd
+
+    close = random_walk(504)
+    # the two seed their averages differently, which decays away well within 200 bars
+    for ta_values, ewm_values in zip(_talib_rsi_macd(close), _ewm_rsi_macd(close)):
+        np.testing.assert_allclose(ta_values[200:], np.asarray(ewm_values)[200:], rtol=0, atol=1e-4)
+
+
+@pytest.mark.parametrize("n", [0, 1, 40, 199, 200, 504])
+def test_ma200_matches_pandas_rolling(n):
+    pytest.importorskip("bottleneck")
+    import src.main as m
+
+    assert m.bn is not None
+    close = random_walk(n)
+    df = m.compute_indicators(pd.DataFrame({"Close": close}))
+    # short histories take the pandas fallback, longer ones bottleneck's move_mean
+    expected = close.astype(np.float32).rolling(m.MA_PERIOD, min_periods=1).mean()
+    np.testing.assert_allclose(df["MA200"].to_numpy(), expected.to_numpy(dtype=np.float32), rtol=1e-6)
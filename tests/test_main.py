@@ -1,4 +1,27 @@
-from src.main import add
+import pandas as pd
 
-def test_add():
-    assert add(2, 3) == 5
+import src.main as m
+from src.main import ETF_LIST, main
+
+
+def test_module_imports():
+    assert callable(main)
+    assert len(ETF_LIST) == len(set(ETF_LIST))
+
+
+def test_analyze_etf_returns_none_without_data(monkeypatch, tmp_path):
+    monkeypatch.setattr(m, "PRICE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(m.yf, "download", lambda *args, **kwargs: pd.DataFrame())
+    m._fetch_price_df.cache_clear()
+    assert m.analyze_etf("NONE") is None
+
+
+def test_second_check_without_data_sends_note(monkeypatch, tmp_path):
+    sent = []
+    monkeypatch.setattr(m, "OUT_DIR", str(tmp_path))
+    monkeypatch.setattr(m, "send_slack_message", sent.append)
+    monkeypatch.setattr(m, "send_email", sent.append)
+    m.second_check({})
+    assert len(sent) == 2
+    assert all("No price data" in msg for msg in sent)
+    assert not (tmp_path / "summary.csv").exists()
@@ -0,0 +1,87 @@
+import json
+import os
+import time
+
+import pytest
+
+import src.main as m
+
+
+def write_cache(ticker, pe, ts):
+    os.makedirs(m.PE_CACHE_DIR, exist_ok=True)
+    with open(os.path.join(m.PE_CACHE_DIR, f"{ticker}.json"), "w") as f:
+        json.dump({"pe": pe, "ts": ts}, f)
+
+
+def read_cache(ticker):
+    with open(os.path.join(m.PE_CACHE_DIR, f"{ticker}.json")) as f:
+        return json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(m, "PE_CACHE_DIR", str(tmp_path))
+    m.fetch_pe.cache_clear()
+    yield
+    m.fetch_pe.cache_clear()
+
+
+@pytest.fixture
+def tickers(monkeypatch):
+    # yf.Ticker stand-in: .info comes from `infos` (an exception instance is raised), calls are recorded
+    calls = []
+    infos = {}
+
+    class FakeTicker:
+        def __init__(self, ticker):
+            calls.append(ticker)
+            self.ticker = ticker
+
+        @property
+        def info(self):
+            info = infos[self.ticker]
+            if isinstance(info, Exception):
+                raise info
+            return info
+
+    monkeypatch.setattr(m.yf, "Ticker", FakeTicker)
+    return calls, infos
+
+
+def test_fresh_entry_skips_yfinance(tickers):
+    calls, _ = tickers
+    write_cache("AAA", 18.5, time.time() - 60)
+    assert m.fetch_pe("AAA") == 18.5
+    assert calls == []
+
+
+def test_expired_entry_is_refetched(tickers):
+    calls, infos = tickers
+    infos["AAA"] = {"trailingPE": 21.0}
+    write_cache("AAA", 18.5, time.time() - m.PE_CACHE_TTL - 1)
+    assert m.fetch_pe("AAA") == 21.0
+    assert calls == ["AAA"]
+    assert read_cache("AAA")["pe"] == 21.0
+
+
+def test_missing_pe_is_cached(tickers):
+    calls, infos = tickers
+    infos["AAA"] = {}
+    assert m.fetch_pe("AAA") is None
+    assert read_cache("AAA")["pe"] is None
+    # a new process (empty lru_cache) reads the None from disk instead of asking again
+    m.fetch_pe.cache_clear()
+    assert m.fetch_pe("AAA") is None
+    assert calls == ["AAA"]
+
+
+def test_lookup_error_is_not_cached(tickers):
+    calls, infos = tickers
+    infos["AAA"] = RuntimeError("rate limited")
+    assert m.fetch_pe("AAA") is None
+    assert not os.path.exists(os.path.join(m.PE_CACHE_DIR, "AAA.json"))
+    # the next run retries the lookup
+    m.fetch_pe.cache_clear()
+    infos["AAA"] = {"trailingPE": 21.0}
+    assert m.fetch_pe("AAA") == 21.0
+    assert calls == ["AAA", "AAA"]
@@ -0,0 +1,94 @@
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.main as m
+
+
+def fixed_now(monkeypatch, *args):
+    now = datetime(*args, tzinfo=m.MARKET_TZ)
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz)
+
+    monkeypatch.setattr(m, "datetime", FixedDatetime)
+
+
+@pytest.mark.parametrize("now, expected_close", [
+    ((2026, 10, 14, 10, 0), (2026, 10, 13, 16, 0)),  # Wednesday before the close
+    ((2026, 10, 14, 16, 0), (2026, 10, 14, 16, 0)),  # Wednesday at the close
+    ((2026, 10, 14, 17, 30), (2026, 10, 14, 16, 0)),  # Wednesday after the close
+    ((2026, 10, 12, 9, 0), (2026, 10, 9, 16, 0)),  # Monday morning rolls back to Friday
+    ((2026, 10, 17, 12, 0), (2026, 10, 16, 16, 0)),  # Saturday
+    ((2026, 10, 18, 20, 0), (2026, 10, 16, 16, 0)),  # Sunday evening
+])
+def test_last_market_close(monkeypatch, now, expected_close):
+    fixed_now(monkeypatch, *now)
+    assert m._last_market_close() == datetime(*expected_close, tzinfo=m.MARKET_TZ).timestamp()
+
+
+def price_frame(n=5):
+    close = np.arange(100.0, 100.0 + n)
+    return pd.DataFrame({"Open": close, "Close": close}, index=pd.bdate_range("2026-10-01", periods=n))
+
+
+def write_cache(ticker, mtime, period=m.PERIOD):
+    path = m._price_cache_path(ticker, period)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    price_frame().to_pickle(path)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    last_close = time.time() - 3600
+    monkeypatch.setattr(m, "PRICE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(m, "_last_market_close", lambda: last_close)
+    return last_close
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    calls = []
+
+    def fake_download(tickers, **kwargs):
+        calls.append(list(tickers))
+        return pd.concat({t: price_frame() for t in tickers}, axis=1)
+
+    monkeypatch.setattr(m.yf, "download", fake_download)
+    return calls
+
+
+def test_read_price_cache_expires_at_market_close(cache):
+    write_cache("FRESH", cache + 60)
+    write_cache("STALE", cache - 60)
+    pd.testing.assert_frame_equal(m._read_price_cache("FRESH", m.PERIOD), price_frame(), check_freq=False)
+    assert m._read_price_cache("STALE", m.PERIOD) is None
+    assert m._read_price_cache("MISSING", m.PERIOD) is None
+
+
+def test_bulk_fetch_with_fresh_cache_downloads_nothing(cache, downloads):
+    for ticker in ("AAA", "BBB"):
+        write_cache(ticker, cache + 60)
+    price_dfs = m.fetch_bulk_price_dfs(["AAA", "BBB"])
+    assert downloads == []
+    assert list(price_dfs) == ["AAA", "BBB"]
+
+
+def test_bulk_fetch_downloads_only_stale_and_missing(cache, downloads):
+    write_cache("AAA", cache + 60)
+    write_cache("BBB", cache - 60)
+    price_dfs = m.fetch_bulk_price_dfs(["AAA", "BBB", "CCC"])
+    assert downloads == [["BBB", "CCC"]]
+    assert list(price_dfs) == ["AAA", "BBB", "CCC"]
+    assert not any(df.empty for df in price_dfs.values())
+
+    # the re-downloaded tickers were written back, so a second run is fully cached
+    m.fetch_bulk_price_dfs(["AAA", "BBB", "CCC"])
+    assert downloads == [["BBB", "CCC"]]
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.main as m
+from src.main import generate_signals
+
+NAN = np.nan
+
+
+def make_frame(rows):
+    # rows of (Close, MA200, RSI, MACD, MACD_signal), float32 like compute_indicators
+    df = pd.DataFrame(rows, columns=["Close", "MA200", "RSI", "MACD", "MACD_signal"],
+                      index=pd.bdate_range("2024-01-01", periods=len(rows)))
+    return df.astype(np.float32)
+
+
+# bar 1 crosses MACD down with RSI > 70 above MA200, bar 2 crosses up with RSI < 40 below it
+CROSSES = [
+    (90.0, 100.0, 30.0, 1.0, 0.0),
+    (110.0, 100.0, 80.0, -1.0, 0.0),
+    (90.0, 100.0, 30.0, 1.0, 0.0),
+]
+
+
+@pytest.mark.parametrize("pe_val, expected_buy, expected_sell", [
+    (None, [False, False, True], [False, True, False]),
+    (10.0, [False, False, True], [False, False, False]),  # cheap: buys only
+    (40.0, [False, False, False], [False, True, False]),  # expensive: sells only
+    (25.0, [False, False, False], [False, False, False]),  # PE_BUY_MAX itself: neither
+])
+def test_pe_gates_signals(pe_val, expected_buy, expected_sell):
+    df = generate_signals(make_frame(CROSSES), pe_val)
+    assert df["Buy_Signal"].tolist() == expected_buy
+    assert df["Sell_Signal"].tolist() == expected_sell
+
+
+@pytest.mark.parametrize("rows", [CROSSES[:1], CROSSES[:2], CROSSES[1::-1]])
+def test_no_cross_on_first_bar(rows):
+    # the first bar has no previous MACD to cross from, even if the last bar would wrap into one
+    df = generate_signals(make_frame(rows), None)
+    assert not df["Buy_Signal"].iat[0]
+    assert not df["Sell_Signal"].iat[0]
+
+
+def test_warm_up_rows_never_signal():
+    df = generate_signals(make_frame([
+        (90.0, 100.0, NAN, NAN, NAN),
+        (110.0, 100.0, NAN, NAN, NAN),
+        (90.0, 100.0, 30.0, 1.0, 0.0),  # previous MACD is NaN, so no cross
+        (90.0, 100.0, 30.0, -1.0, 0.0),
+        (90.0, 100.0, 30.0, 1.0, 0.0),
+    ]), None)
+    assert df["Buy_Signal"].tolist() == [False, False, False, False, True]
+    assert not df["Sell_Signal"].any()
+    assert df["Buy_Signal"].dtype == bool
+
+
+def float64_indicators(close):
+    # compute_indicators without the float32 narrowing, on the same RSI/MACD branch
+    rsi_macd = m._talib_rsi_macd if m.talib is not None else m._ewm_rsi_macd
+    rsi, macd, macd_signal, _ = rsi_macd(close)
+    return pd.DataFrame({"Close": close, "RSI": np.asarray(rsi), "MACD": np.asarray(macd),
+                         "MACD_signal": np.asarray(macd_signal),
+                         "MA200": close.rolling(m.MA_PERIOD, min_periods=1).mean()})
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_float32_indicators_give_float64_signals(seed):
+    rng = np.random.default_rng(seed)
+    close = pd.Series(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.015, 504))),
+                      index=pd.bdate_range("2023-01-02", periods=504)).round(2)
+    narrow = generate_signals(m.compute_indicators(pd.DataFrame({"Close": close})), None)
+    wide = generate_signals(float64_indicators(close), None)
+    assert narrow["Buy_Signal"].tolist() == wide["Buy_Signal"].tolist()
+    assert narrow["Sell_Signal"].tolist() == wide["Sell_Signal"].tolist()
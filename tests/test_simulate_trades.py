@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.main as m
+
+
+def make_frame(buys, sells, close=None):
+    n = len(buys)
+    close = np.arange(100.0, 100.0 + n) if close is None else np.asarray(close, dtype=np.float64)
+    return pd.DataFrame({
+        "Close": close.astype(np.float32),
+        "Buy_Signal": np.asarray(buys, dtype=bool),
+        "Sell_Signal": np.asarray(sells, dtype=bool),
+    }, index=pd.bdate_range("2024-01-01", periods=n))
+
+
+def run_both(monkeypatch, df):
+    results = []
+    for use_numba in (True, False):
+        monkeypatch.setattr(m, "USE_NUMBA", use_numba)
+        results.append(m.simulate_trades(df.copy()))
+    return results
+
+
+def assert_same(numba_trades, vectorized_trades):
+    pd.testing.assert_frame_equal(numba_trades, vectorized_trades)
+
+
+def test_repeated_buys_while_open_are_ignored(monkeypatch):
+    df = make_frame(buys=[1, 1, 0, 1, 0, 0], sells=[0, 0, 0, 0, 1, 0])
+    numba_trades, vectorized_trades = run_both(monkeypatch, df)
+    assert_same(numba_trades, vectorized_trades)
+    assert list(numba_trades["buy_date"]) == [df.index[0]]
+    assert list(numba_trades["sell_date"]) == [df.index[4]]
+    assert numba_trades["buy_price"].tolist() == [100.0]
+    assert numba_trades["sell_price"].tolist() == [104.0]
+    assert numba_trades["profit_pct"].tolist() == pytest.approx([4.0])
+
+
+def test_sell_without_position_is_ignored(monkeypatch):
+    df = make_frame(buys=[0, 0, 1, 0, 0], sells=[1, 0, 0, 1, 1])
+    numba_trades, vectorized_trades = run_both(monkeypatch, df)
+    assert_same(numba_trades, vectorized_trades)
+    assert list(numba_trades["buy_date"]) == [df.index[2]]
+    assert list(numba_trades["sell_date"]) == [df.index[3]]
+
+
+def test_position_open_at_end(monkeypatch):
+    df = make_frame(buys=[1, 0, 0, 1, 0], sells=[0, 1, 0, 0, 0])
+    numba_trades, vectorized_trades = run_both(monkeypatch, df)
+    assert_same(numba_trades, vectorized_trades)
+    assert len(numba_trades) == 2
+    last = numba_trades.iloc[-1]
+    assert last["buy_date"] == df.index[3]
+    assert pd.isna(last["sell_date"])
+    assert np.isnan(last["sell_price"])
+    assert np.isnan(last["profit_pct"])
+
+
+@pytest.mark.parametrize("buys, sells", [
+    ([0, 0, 0, 0], [0, 1, 0, 1]),
+    ([], []),
+])
+def test_no_trades(monkeypatch, buys, sells):
+    df = make_frame(buys=buys, sells=sells)
+    numba_trades, vectorized_trades = run_both(monkeypatch, df)
+    assert_same(numba_trades, vectorized_trades)
+    assert numba_trades.empty
+    assert list(numba_trades.columns) == ["buy_date", "buy_price", "sell_date", "sell_price", "profit_pct"]
+
+
+def test_random_frames_match(monkeypatch):
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        n = int(rng.integers(0, 60))
+        buys = rng.random(n) < 0.3
+        # generate_signals never fires both on one bar (RSI_BUY < RSI_SELL)
+        sells = (rng.random(n) < 0.3) & ~buys
+        df = make_frame(buys, sells, close=rng.uniform(50, 150, n))
+        assert_same(*run_both(monkeypatch, df))